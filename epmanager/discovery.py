@@ -1,24 +1,91 @@
-import importlib, os
-import toml
+import importlib, os, sys
 from . import main
 
 
-def _is_module_or_package(path, name, ignore):
-    if os.path.isdir(os.path.join(path, name)):
-        return None if name in ignore else name
-    else:
-        name, ext = os.path.splitext(name)
-        return name if ext == '.py' else None
+def _is_module_or_package(entry, ignore):
+    # Check the name first - it's free, while is_dir() may need a stat.
+    name = entry.name
+    if name in ignore or name.startswith('.'):
+        return None
+    if entry.is_dir(follow_symlinks=False):
+        return name
+    # A package's __init__ contents are found on the package module itself;
+    # importing it under a second qualname would re-run the decorators.
+    if name.endswith('.py') and name != '__init__.py':
+        return name[:-3]
+    return None
+
+
+def _module_entrypoints(module):
+    # The decorator already stamped each entry point with its name,
+    # so we just look for that attribute on the module's own callables
+    # (skipping anything that was merely imported from elsewhere).
+    for name, value in vars(module).items():
+        if (callable(value)
+                and getattr(value, '__module__', None) == module.__name__
+                and hasattr(value, 'entrypoint_name')):
+            yield value.entrypoint_name, (module.__name__, name)
+
+
+# Qualnames already visited, so that overlapping recursive walks
+# don't redo imports or directory scans.
+_SEEN = set()
 
 
 def _load_everything(qualname, ignore):
-    module_or_package = importlib.import_module(qualname)
+    if qualname in _SEEN:
+        return
+    _SEEN.add(qualname)
+    # Peek at sys.modules first; going through the import machinery takes
+    # the import lock and walks the finders even for loaded modules.
+    module_or_package = (
+        sys.modules.get(qualname) or importlib.import_module(qualname)
+    )
+    yield from _module_entrypoints(module_or_package)
     if hasattr(module_or_package, '__path__'):
-        for path in module_or_package.__path__:
-            for name in os.listdir(path):
-                fixed_name = _is_module_or_package(path, name, ignore)
-                if fixed_name is not None:
-                    _load_everything(f'{qualname}.{fixed_name}', ignore)
+        children = [
+            f'{qualname}.{name}'
+            for path in module_or_package.__path__
+            for name in _scan(path, ignore)
+        ]
+        if children:
+            # Deferred import, as for the TOML machinery above.
+            from concurrent.futures import ThreadPoolExecutor
+            # Prime the child imports in parallel before walking them:
+            # sys.modules insertion is serialized by the import locks,
+            # but the source reads and bytecode compilation overlap,
+            # which helps on cold filesystems.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for _ in executor.map(importlib.import_module, children):
+                    pass
+        for child in children:
+            yield from _load_everything(child, ignore)
+
+
+def _scan(path, ignore):
+    with os.scandir(path) as entries:
+        for entry in entries:
+            fixed_name = _is_module_or_package(entry, ignore)
+            if fixed_name is not None:
+                yield fixed_name
+
+
+def _replace_section(text, header, block):
+    # Textually splice one [section] of a TOML document, leaving the
+    # rest of the file (comments, formatting) untouched.
+    lines = text.splitlines(keepends=True)
+    start = None
+    for i, line in enumerate(lines):
+        if start is None:
+            if line.strip() == header:
+                start = i
+        elif line.lstrip().startswith('['):
+            return ''.join(lines[:start]) + block + '\n' + ''.join(lines[i:])
+    if start is not None: # the section ran to the end of the file
+        return ''.join(lines[:start]) + block
+    if not text.endswith('\n'):
+        text += '\n'
+    return text + '\n' + block
 
 
 @main.entrypoint(
@@ -30,14 +97,30 @@ def _load_everything(qualname, ignore):
 )
 def write_all(ignore=('__pycache__',)):
     """Discover entry points in all source files and update pyproject.toml."""
-    with open('pyproject.toml') as f:
-        data = toml.load(f)
-    poetry = data['tool']['poetry']
-    main._REGISTRY = {}
-    _load_everything(poetry['name'], ignore)
-    poetry['scripts'] = main._REGISTRY
-    with open('pyproject.toml', 'w') as f:
-        toml.dump(data, f)
+    # Deferred: don't make every import of this module pay for the TOML
+    # machinery when only make_wrapper_script is wanted.
+    try:
+        import tomllib
+    except ImportError: # Python < 3.11
+        import tomli as tomllib
+    with open('pyproject.toml', encoding='utf-8') as f:
+        text = f.read()
+    name = tomllib.loads(text)['tool']['poetry']['name']
+    _SEEN.clear() # so a fresh run still sees newly added files
+    # Sorted, so regenerating the file produces stable diffs regardless
+    # of the order the walk encountered the modules in.
+    block = ''.join(
+        ['[tool.poetry.scripts]\n'] + [
+            f'{entry} = "{module}:{attr}.invoke"\n'
+            for entry, (module, attr) in sorted(_load_everything(name, ignore))
+        ]
+    )
+    # Only the scripts section is regenerated; everything else survives
+    # verbatim (a full load/dump round-trip would drop comments). The
+    # result replaces the original atomically.
+    with open('pyproject.toml.tmp', 'w', encoding='utf-8') as f:
+        f.write(_replace_section(text, '[tool.poetry.scripts]', block))
+    os.replace('pyproject.toml.tmp', 'pyproject.toml')
 
 
 @main.entrypoint(name='epmanager-wrapper', cmd='name of command to wrap')
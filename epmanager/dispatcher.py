@@ -1,5 +1,16 @@
 from abc import ABC, abstractmethod
 from inspect import Parameter, _empty
+from operator import attrgetter
+
+
+# Hoisted so that classifying each parameter costs a local lookup
+# rather than an attribute access on the enum per comparison.
+_POSITIONAL_OR_KEYWORD = Parameter.POSITIONAL_OR_KEYWORD
+_VAR_POSITIONAL = Parameter.VAR_POSITIONAL
+_KEYWORD_ONLY = Parameter.KEYWORD_ONLY
+_VAR_KEYWORD = Parameter.VAR_KEYWORD
+# One C-level call fetching both attributes the setup loop needs.
+_KIND_AND_DEFAULT = attrgetter('kind', 'default')
 
 
 class Dispatcher(ABC):
@@ -39,26 +50,20 @@ class Dispatcher(ABC):
         raise NotImplementedError
 
 
-def _get_arg(code, args_dict):
-    literal, value = code
-    try:
-        return value if literal else args_dict[value]
-    except KeyError:
-        assert False, f'decorator failed to provide value for `{value}` arg'
-
-
 class DefaultDispatcher(Dispatcher):
     def __init__(self, param_specs):
         # Keep track of added options and arguments, and what they dispatch to.
-        # Dispatch entries are tuples of (bool, value)
+        # Dispatch entries are a (bool, value) pair held in parallel arrays
         # when the bool is true: the value will be passed as-is
         # when the bool is false: the named key will be looked up.
-        self._positional = []
+        self._pos_literal = []
+        self._pos_payload = []
         # VAR_POSITIONAL params can't have a default value. But we can also
         # make a call with *args that are empty even if the function doesn't
         # have such a parameter.
         self._var_positional = (True, [])
-        self._keywords = {}
+        self._kw_literal = {}
+        self._kw_payload = {}
         # If the function doesn't accept **kwargs, we need to track that fact.
         # So we start out by not providing a dict for them.
         self._var_keywords = None
@@ -67,91 +72,154 @@ class DefaultDispatcher(Dispatcher):
         # -1 = use var_positional;
         # None = check keywords and use var_keywords otherwise.
         self._param_mapping = {}
+        # Parameters with no default value, which guarantee() hasn't
+        # (yet) promised to fill; validate() just checks these are empty.
+        self._needs_positional = set()
+        self._needs_keywords = set()
         for name, param in param_specs:
             # This should only get set on the last iteration, if at all.
             assert self._var_keywords is None
             assert param.name == name
-            self._setup(name, param.kind, param.default)
+            self._setup(name, *_KIND_AND_DEFAULT(param))
 
 
     def _setup(self, name, kind, default):
-        if kind == Parameter.POSITIONAL_OR_KEYWORD:
-            self._param_mapping[name] = len(self._positional)
-            self._positional.append((True, default))
-        elif kind == Parameter.VAR_POSITIONAL:
-            # There is at most one parameter of this type.
-            assert -1 not in self._param_mapping.values()
-            assert default is _empty
-            self._param_mapping[name] = -1
-        elif kind == Parameter.KEYWORD_ONLY:
-            self._param_mapping[name] = None
-            self._keywords[name] = (True, default)
-        elif kind == Parameter.VAR_KEYWORD:
-            # We don't refer to this parameter by name;
-            # instead, extra parameters get dumped here.
-            # Since these are never supplied from a default, we use
-            # a set of names, and ignore cases where they aren't found.
-            self._var_keywords = set() # this should be the last parameter.
-        else:
+        try:
+            handler = self._SETUP_HANDLERS[kind]
+        except KeyError:
             # POSITIONAL_ONLY (C interface stuff) is disallowed for now.
-            assert False, \
-            f'`{kind!s}` parameter in function signature not allowed'
+            raise TypeError(
+                f'`{kind!s}` parameter in function signature not allowed'
+            ) from None
+        handler(self, name, default)
+
+
+    def _setup_positional(self, name, default):
+        if default is _empty:
+            self._needs_positional.add(len(self._pos_payload))
+        self._param_mapping[name] = len(self._pos_payload)
+        self._pos_literal.append(True)
+        self._pos_payload.append(default)
+
+
+    def _setup_var_positional(self, name, default):
+        # There is at most one parameter of this type.
+        assert -1 not in self._param_mapping.values()
+        assert default is _empty
+        self._param_mapping[name] = -1
+
+
+    def _setup_keyword_only(self, name, default):
+        if default is _empty:
+            self._needs_keywords.add(name)
+        self._param_mapping[name] = None
+        self._kw_literal[name] = True
+        self._kw_payload[name] = default
+
+
+    def _setup_var_keyword(self, name, default):
+        # We don't refer to this parameter by name;
+        # instead, extra parameters get dumped here.
+        # Since these are never supplied from a default, we use
+        # a set of names, and ignore cases where they aren't found.
+        self._var_keywords = set() # this should be the last parameter.
+
+
+    _SETUP_HANDLERS = {
+        _POSITIONAL_OR_KEYWORD: _setup_positional,
+        _VAR_POSITIONAL: _setup_var_positional,
+        _KEYWORD_ONLY: _setup_keyword_only,
+        _VAR_KEYWORD: _setup_var_keyword
+    }
 
 
     def guarantee(self, signature_name:str):
         # Any errors that occur here are a programming error at startup,
         # since it means the decorator can't possibly work properly.
-        # So we upgrade exceptions to assertions.
-        dispatch_code = (False, signature_name)
+        # They are raised as real exceptions (rather than assertions) so
+        # they still fire when running under -O; the invocation hot path
+        # itself carries no checks at all.
         try:
             where = self._param_mapping[signature_name]
         except KeyError:
-            assert self._var_keywords is not None, ''.join((
-                f'decorator attempts to feed data to `{param_name}`',
-                'which is not a parameter of the function',
-                'and there is no **kwargs parameter'
-            ))
+            if self._var_keywords is None:
+                raise TypeError(' '.join((
+                    f'decorator attempts to feed data to `{signature_name}`',
+                    'which is not a parameter of the function',
+                    'and there is no **kwargs parameter'
+                ))) from None
             self._var_keywords.add(signature_name)
         else:
             # The parameter is known to exist, so locate it.
             if where is None:
-                self._keywords[signature_name] = dispatch_code
+                self._needs_keywords.discard(signature_name)
+                self._kw_literal[signature_name] = False
+                self._kw_payload[signature_name] = signature_name
             elif where == -1:
-                self._var_positional = dispatch_code
+                self._var_positional = (False, signature_name)
             else:
-                self._positional[where] = dispatch_code
+                self._needs_positional.discard(where)
+                self._pos_literal[where] = False
+                self._pos_payload[where] = signature_name
 
 
     def validate(self):
-        invalid = (True, _empty)
-        invalid_positions = [
-            i for i, x in enumerate(self._positional) if x == invalid
+        if self._needs_positional or self._needs_keywords:
+            raise ValueError(' '.join((
+                f'positional parameters {sorted(self._needs_positional)}',
+                f'and/or keyword-only parameters {self._needs_keywords}',
+                f'have neither a default value nor a way to be supplied',
+                f'by the decorator'
+            )))
+        self._compile()
+
+
+    def _compile(self):
+        # Once validated, the dispatch table is frozen, so instead of
+        # interpreting it per call we bake it into a straight-line call
+        # expression. Literal values are bound into the namespace that the
+        # generated code is exec'd in; everything else is a dict lookup.
+        namespace = {}
+        def _bind(label, literal, value):
+            if not literal:
+                return f'args_dict[{value!r}]'
+            namespace[label] = value
+            return label
+        args = [
+            _bind(f'_p{i}', literal, value)
+            for i, (literal, value) in enumerate(
+                zip(self._pos_literal, self._pos_payload)
+            )
         ]
-        invalid_keywords = {
-            k for k, v in self._keywords.items() if v == invalid
-        }
-        assert not (invalid_positions or invalid_keywords), ' '.join((
-            f'positional parameters {invalid_positions} and/or',
-            f'keyword-only parameters {invalid_keywords} have neither',
-            f'a default value nor a way to be supplied by the decorator'
-        ))
+        literal, value = self._var_positional
+        if not literal:
+            args.append(f'*args_dict[{value!r}]')
+        elif value:
+            args.append('*' + _bind('_star', literal, value))
+        args.extend(
+            f'{name}={_bind(f"_k_{name}", literal, self._kw_payload[name])}'
+            for name, literal in self._kw_literal.items()
+        )
+        if self._var_keywords is not None:
+            # Frozen now that guarantee() can add no more names; the
+            # intersection is one C call instead of a membership test
+            # per candidate name.
+            namespace['_extra'] = frozenset(self._var_keywords)
+            args.append(
+                '**{name: args_dict[name]'
+                ' for name in _extra & args_dict.keys()}'
+            )
+        if not args:
+            # Nothing to dispatch (common for admin-style commands);
+            # skip the exec and call the function directly.
+            self._invoke = lambda func, args_dict: func()
+            return
+        exec('\n'.join((
+            'def _invoke(func, args_dict):',
+            f'    return func({", ".join(args)})'
+        )), namespace)
+        self._invoke = namespace['_invoke']
 
 
     def invoke(self, func, args_dict:dict):
-        positional = [_get_arg(code, args_dict) for code in self._positional]
-        var_args = _get_arg(self._var_positional, args_dict)
-        try:
-            positional.extend(var_args)
-        except TypeError:
-            assert False, '*args value from decorator was not iterable'
-        keywords = {
-            name: _get_arg(code, args_dict)
-            for name, code in self._keywords.items()
-        }
-        if self._var_keywords is not None:
-            keywords.update(
-                (name, args_dict[name])
-                for name in self._var_keywords
-                if name in args_dict
-            )
-        return func(*positional, **keywords)
+        return self._invoke(func, args_dict)
@@ -131,3 +131,12 @@ def positional_by_keyword(first, second):
 def inverse_flag(original_name=True):
     """Test of advanced functionality, inspired by the discovery interface."""
     return original_name
+
+
+@my_entrypoint(
+    parser_class=parser.FastParser,
+    arg='an argument', _opt={'help': 'an option', 'type': int}
+)
+def fast(arg, opt=42):
+    """Test of the minimal FastParser."""
+    return f'arg={arg}, opt={opt}'
@@ -1,25 +1,38 @@
 from functools import partial
-from inspect import signature as signature_of
-from .parser import DefaultParser
+from weakref import WeakValueDictionary
+from .parser import cached_signature, DefaultParser
 from .dispatcher import DefaultDispatcher
 
 
-_REGISTRY = {}
+# Weak references, so the registry tracks live entry points rather than
+# pinning (and growing with) everything that was ever decorated.
+_REGISTRY = WeakValueDictionary()
+_HYPHENATE = str.maketrans('_', '-')
+_MISSING = object()
+
+
+def get_entry_points():
+    """Yield a (name, target) pair for each registered entry point.
+
+    The target is formatted lazily, in the form pyproject.toml wants."""
+    for name, func in _REGISTRY.items():
+        yield name, f'{func.__module__}:{func.__name__}.invoke'
 
 
 def _prepare_name(func, parser_args):
     name = parser_args.get('name', '{name}').format(
-        name=func.__name__.replace('_', '-'), _name=func.__name__
+        name=func.__name__.translate(_HYPHENATE), _name=func.__name__
     )
     parser_args['name'] = func.entrypoint_name = name
-    _REGISTRY[name] = f'{func.__module__}:{func.__name__}.invoke'
+    _REGISTRY[name] = func
 
 
 def _prepare_description(func, parser_args):
-    try:
-        description = parser_args['description']
-    except KeyError:
-        description = func.__doc__.splitlines()[0] if func.__doc__ else ''
+    description = parser_args.get('description', _MISSING)
+    if description is _MISSING:
+        # split with a limit: only the first line is wanted, so don't
+        # scan (and allocate) the rest of a long docstring.
+        description = func.__doc__.split('\n', 1)[0] if func.__doc__ else ''
     assert isinstance(description, str), 'description must be a string'
     parser_args['description'] = func.entrypoint_desc = description
 
@@ -29,10 +42,19 @@ def _setup_entrypoint(
 ):
     _prepare_name(func, parser_args)
     _prepare_description(func, parser_args)
-    func.invoke = parser_class(
-        dispatch_class(signature_of(func).parameters.items()),
-        func, parser_args, specs
-    ).invoke
+    # The parser is only needed if the entry point is actually invoked,
+    # whereas discovery imports every module just to read the names set
+    # above - so defer construction until the first invoke call.
+    parser = None
+    def invoke(command_line=None):
+        nonlocal parser
+        if parser is None:
+            parser = parser_class(
+                dispatch_class(cached_signature(func).parameters.items()),
+                func, parser_args, specs
+            )
+        return parser.invoke(command_line)
+    func.invoke = invoke
     return func
 
 
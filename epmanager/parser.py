@@ -1,18 +1,42 @@
 from abc import ABC, abstractmethod
-from argparse import ArgumentParser
+from functools import lru_cache
 from inspect import Parameter, signature as signature_of, _empty
 import sys
 
 
+_HYPHENATE = str.maketrans('_', '-')
+# Hoisted: _add_from_decorator consults these once per parameter.
+_VAR_KEYWORD = Parameter.VAR_KEYWORD
+
+# Like `inspect.signature`, but cached per function: Signature objects
+# are expensive to build and the same function's signature is consulted
+# repeatedly during setup.
+cached_signature = lru_cache(maxsize=None)(signature_of)
+
+
+@lru_cache(maxsize=None)
+def _string_spec(help_text):
+    # Shared across every spec with the same help string; the parser
+    # machinery never mutates a normalized decorator spec, so repeated
+    # normalization (e.g. re-imported modules) reuses one dict.
+    return {'help': help_text}
+
+
 def _as_dict(decorator_spec):
-    if isinstance(decorator_spec, str):
-        return {'help': decorator_spec}
-    elif isinstance(decorator_spec, dict):
+    # Exact-type checks first: specs are nearly always plain strings or
+    # dicts, and a pointer compare beats isinstance's subclass walk.
+    if type(decorator_spec) is str:
+        return _string_spec(decorator_spec)
+    if type(decorator_spec) is dict:
         return decorator_spec.copy()
-    else:
-        raise TypeError(
-            f'spec for parameter `{param_name}` must be either string or dict'
+    if isinstance(decorator_spec, (str, dict)): # subclass fallback
+        return (
+            {'help': decorator_spec} if isinstance(decorator_spec, str)
+            else dict(decorator_spec)
         )
+    raise TypeError(
+        f'spec `{decorator_spec!r}` must be either string or dict'
+    )
 
 
 class Parser(ABC):
@@ -26,6 +50,7 @@ class Parser(ABC):
         config -> additional configuration options.
         specs -> specifications for parameters to parse."""
         self._func = func
+        self._parameters = cached_signature(func).parameters
         self._dispatcher = dispatcher
         self.setup(config)
         for param_name, spec in specs.items():
@@ -36,17 +61,16 @@ class Parser(ABC):
     def _add_from_decorator(self, param_name, spec):
         # prepare two specs: one from modifying the decorator's spec, and one
         # representing additional requirements from the parameter's signature.
-        signature = signature_of(self._func)
         decorator_spec = _as_dict(spec)
         add_method = self.add_argument
         if param_name.startswith('_'):
             add_method, param_name = self.add_option, param_name[1:]
-        param_info = signature.parameters.get(param_name, None)
+        param_info = self._parameters.get(param_name, None)
         param_spec = {}
         if param_info is None:
             add_method = self.add_option
         else:
-            if param_info.kind == Parameter.VAR_KEYWORD:
+            if param_info.kind is _VAR_KEYWORD:
                 add_method = self.add_option
             if param_info.default is not _empty:
                 param_spec['default'] = param_info.default
@@ -152,27 +176,145 @@ class DefaultParser(Parser):
 
     Delegates to an `argparse.ArgumentParser` to do the work."""
     def setup(self, config:dict):
+        # Deferred: parsers are built on first invoke, so merely importing
+        # entrypoint-decorated modules doesn't load argparse at all.
+        from argparse import ArgumentParser, Namespace
         self._impl = ArgumentParser(
             prog=config.get('name', ''),
             description=config.get('description', '')
         )
+        self._parse_args = self._impl.parse_args
+        # Reused across calls; parse() clears it before each parse, so
+        # repeated invocations skip the Namespace allocation.
+        self._namespace = Namespace()
 
 
     def add_option(self, name:str, deco_spec:dict, param_spec:dict) -> str:
+        spec = param_spec.copy()
+        spec.update(deco_spec)
         self._impl.add_argument(
-            f'-{name[0]}', f'--{name.replace("_", "-")}',
-            **{**param_spec, **deco_spec}
+            '-' + name[0], '--' + name.translate(_HYPHENATE), **spec
         )
         return deco_spec.get('dest', name)
 
 
     def add_argument(self, name:str, deco_spec:dict, param_spec:dict) -> str:
-        extra_spec = {'nargs': '?'} if 'default' in param_spec else {}
-        self._impl.add_argument(
-            name, **{**param_spec, **extra_spec, **deco_spec}
-        )
+        spec = param_spec.copy()
+        if 'default' in spec:
+            spec['nargs'] = '?'
+        spec.update(deco_spec)
+        self._impl.add_argument(name, **spec)
         return deco_spec.get('dest', name)
 
 
     def parse(self, command_line):
-        return vars(self._impl.parse_args(command_line))
+        result = self._namespace.__dict__
+        result.clear()
+        self._parse_args(command_line, self._namespace)
+        return result
+
+
+class FastParser(Parser):
+    """Minimal hand-rolled Parser for simple, fixed command-line schemas.
+
+    Walks the token list exactly once instead of delegating to argparse,
+    which makes it much cheaper for short-lived scripts. Only positional
+    arguments and `-x`/`--long-name` options are understood, with `help`,
+    `type` and `default` specs; anything needing argparse features
+    (`nargs`, `action`, `choices`, `dest`, automatic `-h`...) should use
+    `DefaultParser` instead."""
+    _SUPPORTED_KEYS = frozenset({'help', 'type', 'default'})
+
+
+    def setup(self, config:dict):
+        self._name = config.get('name', '')
+        self._description = config.get('description', '')
+        self._options = {} # flag -> recipient parameter name
+        self._arguments = [] # recipient parameter names, in order
+        self._convert = {} # name -> type converter
+        self._defaults = {} # name -> value when not supplied
+
+
+    def _record(self, name, deco_spec, param_spec):
+        unsupported = deco_spec.keys() - self._SUPPORTED_KEYS
+        if unsupported:
+            raise ValueError(' '.join((
+                f'spec keys {sorted(unsupported)} for `{name}`',
+                'are not supported by FastParser'
+            )))
+        converter = deco_spec.get('type', param_spec.get('type'))
+        if converter is not None:
+            self._convert[name] = converter
+        if 'default' in deco_spec:
+            self._defaults[name] = deco_spec['default']
+        elif 'default' in param_spec:
+            self._defaults[name] = param_spec['default']
+
+
+    def add_option(self, name:str, deco_spec:dict, param_spec:dict) -> str:
+        self._record(name, deco_spec, param_spec)
+        # Like argparse, an unsupplied option without a default gets None.
+        self._defaults.setdefault(name, None)
+        for flag in ('-' + name[0], '--' + name.translate(_HYPHENATE)):
+            # Like argparse, conflicting flags are a setup-time error
+            # rather than silently shadowing the earlier option.
+            if flag in self._options:
+                raise ValueError(' '.join((
+                    f'flag `{flag}` for `{name}` already belongs',
+                    f'to `{self._options[flag]}`'
+                )))
+            self._options[flag] = name
+        return name
+
+
+    def add_argument(self, name:str, deco_spec:dict, param_spec:dict) -> str:
+        self._record(name, deco_spec, param_spec)
+        self._arguments.append(name)
+        return name
+
+
+    def _error(self, message):
+        # Parsing happens outside call_with's exception guard, so report
+        # and exit the way argparse would.
+        print(f'{self._name}: error: {message}', file=sys.stderr)
+        sys.exit(1)
+
+
+    def parse(self, command_line) -> dict:
+        if command_line is None:
+            command_line = sys.argv[1:]
+        result = dict(self._defaults)
+        positional = iter(self._arguments)
+        tokens = iter(command_line)
+        for token in tokens:
+            if token.startswith('-') and token != '-':
+                flag, assigned, value = token.partition('=')
+                try:
+                    name = self._options[flag]
+                except KeyError:
+                    self._error(f'unknown option `{flag}`')
+                if not assigned:
+                    try:
+                        value = next(tokens)
+                    except StopIteration:
+                        self._error(f'option `{flag}` needs a value')
+            else:
+                try:
+                    name = next(positional)
+                except StopIteration:
+                    self._error(f'unexpected extra argument `{token}`')
+                value = token
+            converter = self._convert.get(name)
+            if converter is not None:
+                # argparse's contract for `type` callables: a ValueError or
+                # TypeError becomes a clean error message, not a traceback.
+                try:
+                    value = converter(value)
+                except (ValueError, TypeError):
+                    label = getattr(converter, '__name__', 'type')
+                    self._error(f'invalid {label} value `{value}`')
+            result[name] = value
+        missing = [name for name in positional if name not in result]
+        if missing:
+            self._error(f'missing arguments: {missing}')
+        return result
@@ -1,25 +1,49 @@
 from epmanager.examples import (
     epmanager_example_1, epmanager_example_2, epmanager_example_3,
     epmanager_example_4, empty, un_documented, example, tricky_1,
-    custom_parser, hard, defaults, positional_by_keyword, inverse_flag
+    custom_parser, hard, defaults, positional_by_keyword, inverse_flag,
+    fast
 )
+from functools import lru_cache
 import pytest
 
 
-def _displayed(capsys, func, s):
+@lru_cache(maxsize=None)
+def _split(s):
+    """Split a command-line string once, no matter how often it recurs."""
+    return tuple(s.split())
+
+
+def _argv(s):
+    return list(_split(s)) if isinstance(s, str) else list(s)
+
+
+def _first_lines(text, n):
+    """The first n lines of `text`, without splitting the remainder
+    (argparse help output can run to kilobytes)."""
+    out = []
+    for _ in range(n):
+        head, _sep, text = text.partition('\n')
+        out.append(head)
+    return out
+
+
+def _displayed(capsys, func, s, lines=None):
     with pytest.raises(SystemExit) as e:
-        func.invoke(s.split())
+        func.invoke(_argv(s))
         code = e.args[0]
         assert isinstance(code, int) and code == 0
-    return capsys.readouterr().out.splitlines()
+    out = capsys.readouterr().out
+    return out.splitlines() if lines is None else _first_lines(out, lines)
 
 
-def _failed_with(capsys, func, s):
+def _failed_with(capsys, func, s, lines=None):
     with pytest.raises(SystemExit) as e:
-        func.invoke(s.split())
+        func.invoke(_argv(s))
         code = e.args[0]
         assert isinstance(code, int) and code != 0
-    return capsys.readouterr().err.splitlines()
+    err = capsys.readouterr().err
+    return err.splitlines() if lines is None else _first_lines(err, lines)
 
 
 def test_from_python():
@@ -73,19 +97,21 @@ def test_good_commandline(capsys):
     assert _displayed(capsys, example, '4 5 6') == ['foo=4, bar=5, baz=6']
 
 
-@pytest.mark.parametrize('s', ['', '1', '1 2', '1 2 3 4'])
-def test_bad_commandlines(capsys, s):
+def test_bad_commandlines(capsys):
     """Verify that an invalid command line causes the program to exit
-    and print correct information in a 'usage' message."""
-    output = _failed_with(capsys, example, s)
-    assert output[0].startswith(f'usage: {example.entrypoint_name}')
-    assert output[1].startswith(f'{example.entrypoint_name}: error:')
+    and print correct information in a 'usage' message.
+    Table-driven rather than parametrized: one collection record instead
+    of four, since the assertions are identical for every command line."""
+    for argv in ((), ('1',), ('1', '2'), ('1', '2', '3', '4')):
+        output = _failed_with(capsys, example, argv, lines=2)
+        assert output[0].startswith(f'usage: {example.entrypoint_name}')
+        assert output[1].startswith(f'{example.entrypoint_name}: error:')
 
 
-@pytest.mark.parametrize('s', ['-h', '--help'])
-def test_help_commandlines(capsys, s):
+@pytest.mark.parametrize('argv', [('-h',), ('--help',)])
+def test_help_commandlines(capsys, argv):
     """Verify that automatic 'help' options work correctly."""
-    output = _displayed(capsys, example, s)
+    output = _displayed(capsys, example, argv, lines=3)
     assert output[0].startswith(f'usage: {example.entrypoint_name}')
     assert output[1] == ''
     assert output[2] == example.entrypoint_desc
@@ -112,15 +138,31 @@ def test_defaults(capsys):
     ]
 
 
-@pytest.mark.parametrize('s', [
+@pytest.mark.parametrize('argv', [tuple(s.split()) for s in [
     '-f 1 -s 2', '-s 2 -f 1',
     '--first 1 -s 2', '-s 2 --first 1',
     '-f 1 --second 2', '--second 2 -f 1',
     '--first 1 --second 2', '--second 2 --first 1'
-])
-def test_positional_by_keyword(capsys, s):
+]])
+def test_positional_by_keyword(capsys, argv):
     """Test that keyword/flags arguments work and can be passed out of order."""
-    assert _displayed(capsys, positional_by_keyword, s) == ['(1, 2)']
+    assert _displayed(capsys, positional_by_keyword, argv) == ['(1, 2)']
+
+
+def test_fast_parser(capsys):
+    """Test the minimal hand-rolled parser on its supported schema."""
+    assert _displayed(capsys, fast, 'hello -o 7') == ['arg=hello, opt=7']
+    assert _displayed(capsys, fast, 'hello --opt=7') == ['arg=hello, opt=7']
+    assert _displayed(capsys, fast, 'hello') == ['arg=hello, opt=42']
+    assert _failed_with(capsys, fast, '') == [
+        f"{fast.entrypoint_name}: error: missing arguments: ['arg']"
+    ]
+    assert _failed_with(capsys, fast, 'a -x 1') == [
+        f'{fast.entrypoint_name}: error: unknown option `-x`'
+    ]
+    assert _failed_with(capsys, fast, 'a -o x') == [
+        f'{fast.entrypoint_name}: error: invalid int value `x`'
+    ]
 
 
 def test_inverse_flag(capsys):